@@ -2,21 +2,49 @@ from Models import Orientation
 from PIL import Image
 from pathlib import Path
 from typing import List
+import os
 
+TRANSCRIPT_DIR = Path("/Users/tashitsering/Desktop/B1")
+IMAGE_URL_PREFIX = "https://s3.us-east-1.amazonaws.com/bec.data/OCR-Benchmark/B1/"
+DEFAULT_ORIENTATION = Orientation.LANDSCAPE
+ORIENT_MAP = {o.value: o for o in Orientation}
 
+
+# get_image_url, load_image, determine_orientation and ocr_image are not used by
+# pipeline.py; they stay for callers outside the ingest path
 def get_image_url(name: str) -> str:
-    return f"https://s3.us-east-1.amazonaws.com/bec.data/OCR-Benchmark/B1/{name}"
+    return IMAGE_URL_PREFIX + name
 
 def load_image(image_path: Path) -> Image.Image:
     image = Image.open(image_path)
     image = image.convert("RGB")
     return image
 
+def verify_image(image_path: Path) -> None:
+    # load() decodes the pixels, so truncated or corrupt data raises here;
+    # verify() only checks headers and lets those through
+    with Image.open(image_path) as image:
+        image.load()
+
 def determine_orientation(label: str) -> Orientation:
-    if label == "portrait":
-        return Orientation.PORTRAIT
-    return Orientation.LANDSCAPE
+    return ORIENT_MAP.get(label, DEFAULT_ORIENTATION)
 
 def ocr_image(name: str) -> str:
-    text = Path(f"/Users/tashitsering/Desktop/B1/{name}.txt").read_text(encoding="utf-8", )
+    text = (TRANSCRIPT_DIR / f"{name}.txt").read_text(encoding="utf-8", )
     return text 
+
+def load_all_transcripts(folder: Path, stems: set[str]) -> dict[str, bytes]:
+    # Keys are case-folded stems, matching like the case-insensitive macOS default filesystem
+    stems = {stem.casefold() for stem in stems}
+    transcripts = {}
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            name = entry.name.casefold()
+            if entry.is_file() and name.endswith(".txt") and name[:-4] in stems:
+                with open(entry.path, "rb") as file:
+                    transcripts[name[:-4]] = file.read()
+    return transcripts
+
+def decode_transcript(data: bytes) -> str:
+    # Same result as read_text: strict UTF-8 with universal newlines
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
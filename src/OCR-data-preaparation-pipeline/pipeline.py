@@ -1,10 +1,16 @@
-from Service import ocr_image, determine_orientation, get_image_url, load_image
+from Service import (
+    DEFAULT_ORIENTATION, IMAGE_URL_PREFIX, ORIENT_MAP, TRANSCRIPT_DIR,
+    verify_image, load_all_transcripts, decode_transcript
+)
 from utils import save_json, save_failed_ids, read_json
-from Models import OCRData, OCRDataList
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tqdm import tqdm
+import os
 
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.tif', '.tiff')
 
 def process_images(folder_path: Path, orientation_file: Path):
     ocr_data_list = []
@@ -12,32 +18,34 @@ def process_images(folder_path: Path, orientation_file: Path):
     
     orientations = read_json(orientation_file)
 
-    image_extensions = {'.jpg', '.jpeg', '.png', '.tif', '.tiff', '.JPG', '.JPEG', '.PNG', '.TIF', '.TIFF'}
-    images = [f for f in folder_path.iterdir() if f.suffix in image_extensions]
+    with os.scandir(folder_path) as entries:
+        images = sorted(Path(e.path) for e in entries if e.is_file() and e.name.lower().endswith(IMAGE_EXTENSIONS))
+
+    transcripts = load_all_transcripts(TRANSCRIPT_DIR, {p.stem for p in images})
     
-    for image_path in tqdm(images, desc="Processing images"):
-        name = image_path.name
-        url = get_image_url(name)
-        
-        try:
-            image = load_image(image_path)
-            transcript = ocr_image(image_path.stem)
-            orientation = determine_orientation(orientations[name])
-            ocr_data = OCRData(
-                name=name, 
-                url=url, 
-                transcript=transcript, 
-                orientation=orientation
-            )
-            ocr_data_list.append(ocr_data)
-        except Exception as e:
-            print(f"\nError processing {name}: {e}")
-            failed_ids.append(name)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(verify_image, p) for p in images]
+        for image_path, fut in tqdm(zip(images, futures), total=len(images), desc="Processing images"):
+            name = image_path.name
+
+            try:
+                fut.result()
+                transcript = decode_transcript(transcripts[image_path.stem.casefold()])
+                label = orientations[name]
+                orientation = label if label in ORIENT_MAP else DEFAULT_ORIENTATION.value
+                ocr_data_list.append({
+                    "name": name,
+                    "url": IMAGE_URL_PREFIX + name,
+                    "orientation": orientation,
+                    "transcript": transcript,
+                })
+            except Exception as e:
+                print(f"\nError processing {name}: {e}")
+                failed_ids.append(name)
     
     DATA_DIR.mkdir(exist_ok=True)
     
-    validated_data = OCRDataList(ocr_data_list)
-    save_json(validated_data.model_dump(mode="json"), DATA_DIR / "b1.json")
+    save_json(ocr_data_list, DATA_DIR / "b1.json")
     save_failed_ids(failed_ids, DATA_DIR / "failed_b1.txt")
     
     print(f"\nProcessed: {len(ocr_data_list)} images")
@@ -1,15 +1,28 @@
-from json import load, dump
 from pathlib import Path
+import orjson
 
-def read_json(file_path: Path) -> dict:
-    with open(file_path, 'r') as file:
-        return load(file)
+# ijson is optional (the 'stream' extra); without it large files are read whole
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
-def save_json(data: dict, file_path: Path):
-    with open(file_path, 'w', encoding="utf-8") as file:
-        dump(data, file, indent=2, ensure_ascii=False)
+# Files larger than this are parsed incrementally instead of read whole
+STREAM_THRESHOLD_BYTES = 256 * 1024 * 1024
+
+def read_json(file_path: Path, stream_threshold: int = STREAM_THRESHOLD_BYTES) -> dict:
+    if ijson is not None and Path(file_path).stat().st_size > stream_threshold:
+        return stream_json_map(file_path)
+    return orjson.loads(Path(file_path).read_bytes())
+
+def stream_json_map(file_path: Path) -> dict:
+    if ijson is None:
+        raise ImportError("stream_json_map requires ijson; install the 'stream' extra")
+    with open(file_path, 'rb') as file:
+        return dict(ijson.kvitems(file, '', use_float=True))
+
+def save_json(data: dict | list, file_path: Path):
+    Path(file_path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
 def save_failed_ids(failed_ids: list[str], file_path: Path):
-    with open(file_path, 'w') as file:
-        for fid in failed_ids:
-            file.write(f"{fid}\n")
\ No newline at end of file
+    Path(file_path).write_bytes(("\n".join(failed_ids) + "\n").encode("utf-8") if failed_ids else b"")
\ No newline at end of file
@@ -10,22 +10,36 @@ Threading concept:
 
 import sys
 import os
-import json
+import orjson
 from pathlib import Path
 from threading import Thread
-from queue import Queue
+from queue import Queue, Empty, Full
+from concurrent.futures import ThreadPoolExecutor
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QFileDialog
 )
-from PyQt6.QtGui import QPixmap, QKeyEvent
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap, QPixmapCache, QKeyEvent
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 
 
 # How many images to keep loaded ahead
 PREFETCH_COUNT = 20
 
+# How many images the loader decodes at the same time
+LOADER_WORKERS = 4
+
+# Memory (KB) Qt may use for preloaded images before evicting the least recently used
+CACHE_LIMIT_KB = 64 * 1024
+
+# Loaded images waiting for the UI thread; the loader blocks when this is full
+QUEUE_SIZE = PREFETCH_COUNT // 4
+
+# How often (ms) the UI thread drains the queue, and how many images per tick
+DRAIN_INTERVAL_MS = 16
+DRAIN_PER_TICK = 4
+
 
 class ImageLoader(QThread):
     """
@@ -33,38 +47,69 @@ class ImageLoader(QThread):
     
     Threading 101:
     - Runs separately from the main UI thread
-    - Loads images into a cache dictionary
-    - UI thread reads from cache = instant display!
+    - Puts loaded images on a bounded queue (waits when it is full)
+    - UI thread drains the queue into its cache = instant display!
     """
-    image_ready = pyqtSignal(int, object)  # Signal: (index, pixmap)
     
-    def __init__(self, images, folder, start_index=0):
+    def __init__(self, images, folder, queue, start_index=0):
         super().__init__()
         self.images = images
         self.folder = folder
+        self.queue = queue
         self.start_index = start_index
         self.running = True
         
     def run(self):
         """Load PREFETCH_COUNT images starting from start_index"""
-        for i in range(self.start_index, min(self.start_index + PREFETCH_COUNT, len(self.images))):
-            if not self.running:
-                break
-            img_name = self.images[i]
-            img_path = os.path.join(self.folder, img_name)
-            pixmap = QPixmap(img_path)
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(
-                    780, 430,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                self.image_ready.emit(i, scaled)
+        end_index = min(self.start_index + PREFETCH_COUNT, len(self.images))
+        with ThreadPoolExecutor(max_workers=LOADER_WORKERS) as executor:
+            for i in range(self.start_index, end_index):
+                executor.submit(self._load_one, i)
+                
+    def _load_one(self, i):
+        """Load and scale a single image, then hand it to the UI thread"""
+        if not self.running:
+            return
+        img_name = self.images[i]
+        img_path = os.path.join(self.folder, img_name)
+        # QImage is safe off the GUI thread; the UI thread turns it into a QPixmap
+        image = QImage(img_path)
+        if not image.isNull():
+            scaled = image.scaled(
+                780, 430,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            while self.running:
+                try:
+                    self.queue.put((i, scaled), timeout=0.1)
+                    break
+                except Full:
+                    continue
                 
     def stop(self):
         self.running = False
 
 
+class ResultSaver(QThread):
+    """Writes the serialized results off the UI thread and reports back"""
+    saved = pyqtSignal(str)   # Signal: output path
+    failed = pyqtSignal(str)  # Signal: error message
+    
+    def __init__(self, data, output_path):
+        super().__init__()
+        self.data = data
+        self.output_path = output_path
+        
+    def run(self):
+        try:
+            self.output_path.write_bytes(self.data)
+        except OSError as e:
+            self.failed.emit(str(e))
+            return
+        self.saved.emit(str(self.output_path))
+
+
 class OrientationLabeler(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -73,9 +118,16 @@ class OrientationLabeler(QMainWindow):
         self.results = {}
         self.image_folder = None
         
-        # Image cache - stores preloaded QPixmaps
-        # Key: image index, Value: scaled QPixmap
-        self.cache = {}
+        # Image cache - Qt's QPixmapCache stores preloaded QPixmaps
+        # Key: _cache_key(image index), Value: scaled QPixmap
+        QPixmapCache.setCacheLimit(CACHE_LIMIT_KB)
+        
+        # Bumped per folder so keys from an earlier folder never match
+        self._cache_generation = 0
+        
+        # Indices at or after current_index that have been preloaded
+        # (Qt may evict one silently; show_current_image drops it when found missing)
+        self._cached_ahead = set()
         
         # Track which batch we've loaded
         self.loaded_up_to = 0
@@ -83,6 +135,15 @@ class OrientationLabeler(QMainWindow):
         # Background loader thread
         self.loader = None
         
+        # Background thread writing the results file
+        self.saver = None
+        
+        # Loaded images handed over by the loader, drained by a timer
+        # that only runs while a loader is working
+        self.image_queue = Queue(maxsize=QUEUE_SIZE)
+        self.drain_timer = QTimer(self)
+        self.drain_timer.timeout.connect(self.drain_queue)
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -193,15 +254,23 @@ class OrientationLabeler(QMainWindow):
         if not folder:
             return
             
+        # Stop the old loader before swapping its queue out from under it
+        self.stop_loader()
+        
         self.image_folder = folder
         self.images = []
-        self.cache = {}
+        # QPixmapCache is process-wide, so let old entries age out instead of clearing it
+        self._cache_generation += 1
+        self._cached_ahead = set()
+        self.image_queue = Queue(maxsize=QUEUE_SIZE)
         self.loaded_up_to = 0
         
         extensions = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.tif')
-        for f in sorted(os.listdir(folder)):
-            if f.lower().endswith(extensions):
-                self.images.append(f)
+        with os.scandir(folder) as entries:
+            self.images = sorted(
+                e.name for e in entries
+                if e.is_file() and e.name.lower().endswith(extensions)
+            )
         
         if not self.images:
             self.name_label.setText("No images found in folder")
@@ -223,21 +292,44 @@ class OrientationLabeler(QMainWindow):
         This is the key technique:
         1. We tell the loader to start at from_index
         2. It loads PREFETCH_COUNT images in background
-        3. Each loaded image triggers image_ready signal
-        4. on_image_loaded adds it to our cache
+        3. Each loaded image is put on image_queue
+        4. drain_queue hands it to on_image_loaded, which caches it
         """
-        if self.loader and self.loader.isRunning():
-            self.loader.stop()
-            self.loader.wait()
+        self.stop_loader()
             
-        self.loader = ImageLoader(self.images, self.image_folder, from_index)
-        self.loader.image_ready.connect(self.on_image_loaded)
+        self.loader = ImageLoader(self.images, self.image_folder, self.image_queue, from_index)
         self.loader.start()
+        if not self.drain_timer.isActive():
+            self.drain_timer.start(DRAIN_INTERVAL_MS)
         self.loaded_up_to = from_index + PREFETCH_COUNT
         
+    def stop_loader(self):
+        """Stop the background loader and wait for its workers to exit"""
+        if self.loader and self.loader.isRunning():
+            self.loader.stop()
+            self.loader.wait()
+            
+    def _cache_key(self, index):
+        return f"orientation-labeler:{self._cache_generation}:{index}"
+        
+    def drain_queue(self):
+        """Move up to DRAIN_PER_TICK loaded images from the queue into the cache"""
+        # Check the loader before the queue: once it has stopped, an empty queue stays empty
+        loader_running = self.loader is not None and self.loader.isRunning()
+        for _ in range(DRAIN_PER_TICK):
+            try:
+                index, image = self.image_queue.get_nowait()
+            except Empty:
+                if not loader_running:
+                    self.drain_timer.stop()
+                return
+            self.on_image_loaded(index, QPixmap.fromImage(image))
+            
     def on_image_loaded(self, index, pixmap):
-        """Called by background thread when an image is ready"""
-        self.cache[index] = pixmap
+        """Called by drain_queue when an image is ready"""
+        QPixmapCache.insert(self._cache_key(index), pixmap)
+        if index >= self.current_index:
+            self._cached_ahead.add(index)
         
         # If this is the current image and we're waiting, show it
         if index == self.current_index and self.image_label.pixmap() is None:
@@ -252,14 +344,15 @@ class OrientationLabeler(QMainWindow):
             
         img_name = self.images[self.current_index]
         self.name_label.setText(img_name)
-        self.update_progress()
         
         # Check if image is in cache (preloaded)
-        if self.current_index in self.cache:
+        cached = QPixmapCache.find(self._cache_key(self.current_index))
+        if cached is not None:
             # Instant! Image was preloaded
-            self.image_label.setPixmap(self.cache[self.current_index])
+            self.image_label.setPixmap(cached)
         else:
-            # Not in cache yet - load directly (slower)
+            # Not in cache yet (or evicted by Qt) - load directly (slower)
+            self._cached_ahead.discard(self.current_index)
             self.image_label.clear()
             self.status_label.setText("Loading...")
             img_path = os.path.join(self.image_folder, img_name)
@@ -267,25 +360,16 @@ class OrientationLabeler(QMainWindow):
             scaled = pixmap.scaled(780, 430, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
             self.image_label.setPixmap(scaled)
             self.status_label.setText("Press P for Portrait, L for Landscape")
+        self.update_progress()
             
         # Check if we need to preload more
         # When we're halfway through current batch, start loading next batch
         if self.current_index >= self.loaded_up_to - (PREFETCH_COUNT // 2):
             self.start_preload(self.loaded_up_to)
             
-        # Clean up old cached images (free memory)
-        self.cleanup_cache()
-        
-    def cleanup_cache(self):
-        """Remove images we've already passed to save memory"""
-        old_keys = [k for k in self.cache.keys() if k < self.current_index - 5]
-        for k in old_keys:
-            del self.cache[k]
-            
     def update_progress(self):
-        cached = len([k for k in self.cache.keys() if k >= self.current_index])
         self.progress_label.setText(
-            f"{self.current_index + 1} / {len(self.images)}  •  {cached} preloaded"
+            f"{self.current_index + 1} / {len(self.images)}  •  {len(self._cached_ahead)} preloaded"
         )
         
     def label_image(self, orientation):
@@ -295,6 +379,7 @@ class OrientationLabeler(QMainWindow):
         img_name = self.images[self.current_index]
         self.results[img_name] = orientation
         
+        self._cached_ahead.discard(self.current_index)
         self.current_index += 1
         self.show_current_image()
         
@@ -312,16 +397,19 @@ class OrientationLabeler(QMainWindow):
         project_data_dir = Path(__file__).parent.parent.parent / "data"
         project_data_dir.mkdir(exist_ok=True)
         output_path = project_data_dir / "orientations.json"
-        with open(output_path, 'w') as f:
-            json.dump(self.results, f, indent=2)
-        
-        self.status_label.setText(f"Saved to: {output_path}")
+        # Serialize now, write in the background so the UI isn't blocked
+        data = orjson.dumps(self.results, option=orjson.OPT_INDENT_2)
+        self.status_label.setText(f"Saving to: {output_path}")
+        self.saver = ResultSaver(data, output_path)
+        self.saver.saved.connect(lambda path: self.status_label.setText(f"Saved to: {path}"))
+        self.saver.failed.connect(lambda error: self.status_label.setText(f"Save failed: {error}"))
+        self.saver.start()
         
     def closeEvent(self, event):
         """Clean up when window closes"""
-        if self.loader:
-            self.loader.stop()
-            self.loader.wait()
+        self.stop_loader()
+        if self.saver:
+            self.saver.wait()
         event.accept()
 
 
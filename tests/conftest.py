@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The pipeline modules import each other as top-level modules (e.g. `from Models import ...`)
+sys.path.insert(0, str(Path(__file__).parent.parent / "src" / "OCR-data-preaparation-pipeline"))
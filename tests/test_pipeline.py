@@ -0,0 +1,64 @@
+import json
+
+from PIL import Image
+
+import pipeline
+from Service import IMAGE_URL_PREFIX
+
+
+def make_image(path):
+    Image.new("RGB", (4, 2)).save(path)
+
+
+def make_truncated_image(path):
+    Image.effect_noise((64, 64), 50).convert("RGB").save(path)
+    data = path.read_bytes()
+    path.write_bytes(data[:len(data) // 2])
+
+
+def test_process_images(tmp_path, monkeypatch):
+    images_dir = tmp_path / "images"
+    transcripts_dir = tmp_path / "transcripts"
+    data_dir = tmp_path / "data"
+    images_dir.mkdir()
+    transcripts_dir.mkdir()
+
+    for name in ("good.jpg", "missing.png", "unknown.JPG", "bad.jpg"):
+        make_image(images_dir / name)
+    make_truncated_image(images_dir / "truncated.jpg")
+    (transcripts_dir / "good.txt").write_bytes("ཀ་ཁ\r\nline two".encode("utf-8"))
+    (transcripts_dir / "Unknown.TXT").write_bytes(b"text")
+    (transcripts_dir / "bad.txt").write_bytes(b"\xff\xfe")
+    (transcripts_dir / "truncated.txt").write_bytes(b"text")
+    (transcripts_dir / "unused.txt").write_bytes(b"no image")
+
+    orientation_file = tmp_path / "orientations.json"
+    orientation_file.write_text(json.dumps({
+        "good.jpg": "portrait",
+        "missing.png": "portrait",
+        "unknown.JPG": "sideways",
+        "bad.jpg": "landscape",
+        "truncated.jpg": "portrait",
+    }))
+
+    monkeypatch.setattr(pipeline, "DATA_DIR", data_dir)
+    monkeypatch.setattr(pipeline, "TRANSCRIPT_DIR", transcripts_dir)
+    pipeline.process_images(images_dir, orientation_file)
+
+    rows = json.loads((data_dir / "b1.json").read_text(encoding="utf-8"))
+    assert rows == [
+        {
+            "name": "good.jpg",
+            "url": IMAGE_URL_PREFIX + "good.jpg",
+            "orientation": "portrait",
+            "transcript": "ཀ་ཁ\nline two",
+        },
+        {
+            "name": "unknown.JPG",
+            "url": IMAGE_URL_PREFIX + "unknown.JPG",
+            "orientation": "landscape",
+            "transcript": "text",
+        },
+    ]
+    assert all(list(row) == ["name", "url", "orientation", "transcript"] for row in rows)
+    assert (data_dir / "failed_b1.txt").read_text() == "bad.jpg\nmissing.png\ntruncated.jpg\n"
@@ -0,0 +1,27 @@
+import pytest
+
+import utils
+from utils import read_json
+
+
+ORIENTATIONS = {"a.jpg": "portrait", "b.png": "landscape", "ཀ.tif": "portrait"}
+
+
+def test_read_json(tmp_path):
+    path = tmp_path / "orientations.json"
+    path.write_text('{"a.jpg": "portrait", "b.png": "landscape", "ཀ.tif": "portrait"}', encoding="utf-8")
+    assert read_json(path) == ORIENTATIONS
+
+
+def test_read_json_streams_above_threshold(tmp_path):
+    pytest.importorskip("ijson")
+    path = tmp_path / "orientations.json"
+    path.write_text('{"a.jpg": "portrait", "b.png": "landscape", "ཀ.tif": "portrait"}', encoding="utf-8")
+    assert read_json(path, stream_threshold=0) == ORIENTATIONS
+
+
+def test_read_json_without_ijson_reads_whole_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, "ijson", None)
+    path = tmp_path / "orientations.json"
+    path.write_text('{"a.jpg": "portrait", "b.png": "landscape", "ཀ.tif": "portrait"}', encoding="utf-8")
+    assert read_json(path, stream_threshold=0) == ORIENTATIONS